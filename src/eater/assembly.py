@@ -1,4 +1,5 @@
-from typing import List, Optional, Tuple
+import sys
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 import eater.part
 
@@ -8,7 +9,59 @@ def connect_power(vcc: eater.part.Junction, gnd: eater.part.Junction, part: eate
     part.GND.conductors.append(gnd)
 
 
-class Register:
+def wire(connections: Iterable[Tuple[eater.part.Junction, eater.part.Junction]]):
+    """Connect each pin to its target, given as a table of ``(pin, target)`` pairs."""
+    for pin, target in connections:
+        pin.conductors.append(target)
+
+
+def connect_register_controls(
+        gnd: eater.part.Junction, clr: eater.part.Junction, clk: eater.part.Junction,
+        register_in: eater.part.Junction, register: eater.part.FourBitDRegister):
+    """Connect the clear, clock and data enable lines of a register whose outputs are always enabled."""
+    wire((
+        (register.CLR, clr),
+        (register.CLK, clk),
+        (register.N, gnd),
+        (register.M, gnd),
+        (register.G1, register_in),
+        (register.G2, register_in),
+    ))
+
+
+# Bus lines are indexed least significant bit first, but transceiver pins B1-B8 run most significant bit first.
+_MSB_FIRST = (7, 6, 5, 4, 3, 2, 1, 0)
+
+
+def _leaves(modules) -> Iterator:
+    """Depth-first walk of modules down to the primitive parts they evaluate, in evaluation order."""
+    for module in modules:
+        parts = getattr(module, "parts", None)
+        if parts is None:
+            yield module
+        else:
+            yield from _leaves(parts)
+
+
+def _schedule(modules) -> Tuple[Callable[[], None], ...]:
+    """
+    Flatten modules into a sweep over their primitive parts, keeping the first occurrence of each.
+
+    Parts are keyed on identity so that a part reachable from more than one place is still evaluated once per sweep.
+    """
+    unique = {}
+    for part in _leaves(modules):
+        unique.setdefault(id(part), part.evaluate)
+    return tuple(unique.values())
+
+
+class BusRegister:
+    """
+    Eight-bit register built from a pair of 74LS173s, latched from the bus and written back through a 74LS245.
+
+    The low register always feeds the transceiver. Subclasses wire up the high register's outputs.
+    """
+
     def __init__(
             self,
             vcc: eater.part.Junction, gnd: eater.part.Junction,
@@ -28,7 +81,7 @@ class Register:
         self.high_register = eater.part.FourBitDRegister()
         self.low_register = eater.part.FourBitDRegister()
         self.trans = eater.part.OctalBusTransceiver()
-        self.register_bus = eater.part.Bus([eater.part.Junction() for _ in range(8)])
+        self.parts = (self.low_register, self.high_register, self.trans)
 
         connect_power(vcc, gnd, self.high_register)
         connect_power(vcc, gnd, self.low_register)
@@ -37,111 +90,100 @@ class Register:
         self._connect_low_register_input()
         self._connect_low_register_output()
         self._connect_high_register_input()
-        self._connect_high_register_output()
-        self._connect_control_lines_to_register(self.low_register)
-        self._connect_control_lines_to_register(self.high_register)
+        connect_register_controls(gnd, clr, clk, register_in, self.low_register)
+        connect_register_controls(gnd, clr, clk, register_in, self.high_register)
         self._connect_control_lines_to_transceiver()
         self._connect_bus_output()
 
-    def _connect_control_lines_to_register(self, register: eater.part.FourBitDRegister):
-        register.CLR.conductors.append(self.clr)
-        register.CLK.conductors.append(self.clk)
-        register.N.conductors.append(self.gnd)
-        register.M.conductors.append(self.gnd)
-        register.G1.conductors.append(self.register_in)
-        register.G2.conductors.append(self.register_in)
-
     def _connect_low_register_input(self):
-        self.low_register.D1.conductors.append(self.bus.conductors[3])
-        self.low_register.D2.conductors.append(self.bus.conductors[2])
-        self.low_register.D3.conductors.append(self.bus.conductors[1])
-        self.low_register.D4.conductors.append(self.bus.conductors[0])
+        wire((
+            (self.low_register.D1, self.bus.conductors[3]),
+            (self.low_register.D2, self.bus.conductors[2]),
+            (self.low_register.D3, self.bus.conductors[1]),
+            (self.low_register.D4, self.bus.conductors[0]),
+        ))
 
     def _connect_high_register_input(self):
-        self.high_register.D1.conductors.append(self.bus.conductors[7])
-        self.high_register.D2.conductors.append(self.bus.conductors[6])
-        self.high_register.D3.conductors.append(self.bus.conductors[5])
-        self.high_register.D4.conductors.append(self.bus.conductors[4])
+        wire((
+            (self.high_register.D1, self.bus.conductors[7]),
+            (self.high_register.D2, self.bus.conductors[6]),
+            (self.high_register.D3, self.bus.conductors[5]),
+            (self.high_register.D4, self.bus.conductors[4]),
+        ))
 
     def _connect_low_register_output(self):
-        self.low_register.Q1.conductors.append(self.trans.A5)
-        self.low_register.Q2.conductors.append(self.trans.A6)
-        self.low_register.Q3.conductors.append(self.trans.A7)
-        self.low_register.Q4.conductors.append(self.trans.A8)
+        wire((
+            (self.low_register.Q1, self.trans.A5),
+            (self.low_register.Q2, self.trans.A6),
+            (self.low_register.Q3, self.trans.A7),
+            (self.low_register.Q4, self.trans.A8),
+        ))
 
-        self.low_register.Q1.conductors.append(self.register_bus.conductors[3])
-        self.low_register.Q2.conductors.append(self.register_bus.conductors[2])
-        self.low_register.Q3.conductors.append(self.register_bus.conductors[1])
-        self.low_register.Q4.conductors.append(self.register_bus.conductors[0])
+    def _connect_bus_output(self):
+        wire((self.bus.conductors[bus_line], trans_pin) for bus_line, (trans_pin, _) in zip(_MSB_FIRST, self.trans.b))
 
-    def _connect_high_register_output(self):
-        self.high_register.Q1.conductors.append(self.trans.A1)
-        self.high_register.Q2.conductors.append(self.trans.A2)
-        self.high_register.Q3.conductors.append(self.trans.A3)
-        self.high_register.Q4.conductors.append(self.trans.A4)
+    def _connect_control_lines_to_transceiver(self):
+        wire((
+            (self.trans.DIRECTION, self.vcc),
+            (self.trans.ENABLED, self.register_out),
+        ))
 
-        self.high_register.Q1.conductors.append(self.register_bus.conductors[7])
-        self.high_register.Q2.conductors.append(self.register_bus.conductors[6])
-        self.high_register.Q3.conductors.append(self.register_bus.conductors[5])
-        self.high_register.Q4.conductors.append(self.register_bus.conductors[4])
+    def evaluate(self):
+        for part in self.parts:
+            part.evaluate()
 
-    def _connect_bus_output(self):
-        trans_out = [
-            self.trans.B1,
-            self.trans.B2,
-            self.trans.B3,
-            self.trans.B4,
-            self.trans.B5,
-            self.trans.B6,
-            self.trans.B7,
-            self.trans.B8,
-        ]
-        for bus_c, trans_c in zip(reversed(self.bus.conductors), trans_out):
-            bus_c.conductors.append(trans_c)
 
-    def evaluate(self):
-        self.low_register.evaluate()
-        self.high_register.evaluate()
-        self.trans.evaluate()
+class Register(BusRegister):
+    def __init__(
+            self,
+            vcc: eater.part.Junction, gnd: eater.part.Junction,
+            clr: eater.part.Junction, clk: eater.part.Junction,
+            register_in: eater.part.Junction, register_out: eater.part.Junction,
+            bus: eater.part.Bus):
+        super().__init__(vcc, gnd, clr, clk, register_in, register_out, bus)
 
-    def _connect_control_lines_to_transceiver(self):
-        self.trans.DIRECTION.conductors.append(self.vcc)
-        self.trans.ENABLED.conductors.append(self.register_out)
+        self.register_bus = eater.part.Bus([eater.part.Junction() for _ in range(8)])
+        self._connect_register_bus()
+        self._connect_high_register_output()
+
+    def __str__(self):
+        return f"Register({self.register_bus.int_value:08b})"
 
+    def _connect_register_bus(self):
+        wire((
+            (self.low_register.Q1, self.register_bus.conductors[3]),
+            (self.low_register.Q2, self.register_bus.conductors[2]),
+            (self.low_register.Q3, self.register_bus.conductors[1]),
+            (self.low_register.Q4, self.register_bus.conductors[0]),
 
-class InstructionRegister:
+            (self.high_register.Q1, self.register_bus.conductors[7]),
+            (self.high_register.Q2, self.register_bus.conductors[6]),
+            (self.high_register.Q3, self.register_bus.conductors[5]),
+            (self.high_register.Q4, self.register_bus.conductors[4]),
+        ))
+
+    def _connect_high_register_output(self):
+        wire((
+            (self.high_register.Q1, self.trans.A1),
+            (self.high_register.Q2, self.trans.A2),
+            (self.high_register.Q3, self.trans.A3),
+            (self.high_register.Q4, self.trans.A4),
+        ))
+
+
+class InstructionRegister(BusRegister):
     def __init__(
             self,
             vcc: eater.part.Junction, gnd: eater.part.Junction,
             clr: eater.part.Junction, clk: eater.part.Junction,
             instruction_in: eater.part.Junction, instruction_out: eater.part.Junction,
             instruction_bus: eater.part.Bus, bus: eater.part.Bus):
+        super().__init__(vcc, gnd, clr, clk, instruction_in, instruction_out, bus)
 
-        self.gnd = gnd
-        self.vcc = vcc
-
-        self.clr = clr
-        self.clk = clk
         self.instruction_in = instruction_in
         self.instruction_out = instruction_out
-        self.bus = bus
         self.instruction_bus = instruction_bus
 
-        self.high_register = eater.part.FourBitDRegister()
-        self.low_register = eater.part.FourBitDRegister()
-        self.trans = eater.part.OctalBusTransceiver()
-
-        connect_power(vcc, gnd, self.high_register)
-        connect_power(vcc, gnd, self.low_register)
-        connect_power(vcc, gnd, self.trans)
-
-        self._connect_low_register_input()
-        self._connect_low_register_output()
-        self._connect_high_register_input()
-        self._connect_control_lines_to_register(self.low_register)
-        self._connect_control_lines_to_register(self.high_register)
-        self._connect_control_lines_to_transceiver()
-        self._connect_bus_output()
         self._connect_instruction_bus()
 
     def __str__(self):
@@ -150,63 +192,18 @@ class InstructionRegister:
         return f"InstructionRegister(instruction={instruction}, bus={bus})"
 
     def _connect_instruction_bus(self):
-        for bus_line, (_, output_pin, _) in zip(self.instruction_bus.conductors, self.high_register.lines):
-            bus_line.conductors.append(output_pin)
-
-    def _connect_control_lines_to_register(self, register: eater.part.FourBitDRegister):
-        register.CLR.conductors.append(self.clr)
-        register.CLK.conductors.append(self.clk)
-        register.N.conductors.append(self.gnd)
-        register.M.conductors.append(self.gnd)
-        register.G1.conductors.append(self.instruction_in)
-        register.G2.conductors.append(self.instruction_in)
-
-    def _connect_low_register_input(self):
-        self.low_register.D1.conductors.append(self.bus.conductors[3])
-        self.low_register.D2.conductors.append(self.bus.conductors[2])
-        self.low_register.D3.conductors.append(self.bus.conductors[1])
-        self.low_register.D4.conductors.append(self.bus.conductors[0])
-
-    def _connect_high_register_input(self):
-        self.high_register.D1.conductors.append(self.bus.conductors[7])
-        self.high_register.D2.conductors.append(self.bus.conductors[6])
-        self.high_register.D3.conductors.append(self.bus.conductors[5])
-        self.high_register.D4.conductors.append(self.bus.conductors[4])
-
-    def _connect_low_register_output(self):
-        self.low_register.Q1.conductors.append(self.trans.A5)
-        self.low_register.Q2.conductors.append(self.trans.A6)
-        self.low_register.Q3.conductors.append(self.trans.A7)
-        self.low_register.Q4.conductors.append(self.trans.A8)
-
-    def _connect_bus_output(self):
-        trans_out = [
-            self.trans.B1,
-            self.trans.B2,
-            self.trans.B3,
-            self.trans.B4,
-            self.trans.B5,
-            self.trans.B6,
-            self.trans.B7,
-            self.trans.B8,
-        ]
-        for bus_c, trans_c in zip(reversed(self.bus.conductors), trans_out):
-            bus_c.conductors.append(trans_c)
-
-    def evaluate(self):
-        self.low_register.evaluate()
-        self.high_register.evaluate()
-        self.trans.evaluate()
-
-    def _connect_control_lines_to_transceiver(self):
-        self.trans.DIRECTION.conductors.append(self.vcc)
-        self.trans.ENABLED.conductors.append(self.instruction_out)
+        wire(
+            (bus_line, output_pin)
+            for bus_line, (_, output_pin, _) in zip(self.instruction_bus.conductors, self.high_register.lines)
+        )
 
     def _tie_unused_transceiver_lines_low(self):
-        self.trans.A1.conductors.append(self.gnd)
-        self.trans.A2.conductors.append(self.gnd)
-        self.trans.A3.conductors.append(self.gnd)
-        self.trans.A4.conductors.append(self.gnd)
+        wire((
+            (self.trans.A1, self.gnd),
+            (self.trans.A2, self.gnd),
+            (self.trans.A3, self.gnd),
+            (self.trans.A4, self.gnd),
+        ))
 
 
 class MemoryRegister:
@@ -228,34 +225,33 @@ class MemoryRegister:
         self.register = eater.part.FourBitDRegister()
         self.register_bus = eater.part.Bus([eater.part.Junction() for _ in range(4)])
 
+        self.parts = (self.register,)
+
         connect_power(vcc, gnd, self.register)
 
         self._connect_register_input()
         self._connect_register_output()
-        self._connect_control_lines_to_register()
-
-    def _connect_control_lines_to_register(self):
-        self.register.CLR.conductors.append(self.clr)
-        self.register.CLK.conductors.append(self.clk)
-        self.register.N.conductors.append(self.gnd)
-        self.register.M.conductors.append(self.gnd)
-        self.register.G1.conductors.append(self.memory_in)
-        self.register.G2.conductors.append(self.memory_in)
+        connect_register_controls(gnd, clr, clk, memory_in, self.register)
 
     def _connect_register_input(self):
-        self.register.D1.conductors.append(self.bus.conductors[3])
-        self.register.D2.conductors.append(self.bus.conductors[2])
-        self.register.D3.conductors.append(self.bus.conductors[1])
-        self.register.D4.conductors.append(self.bus.conductors[0])
+        wire((
+            (self.register.D1, self.bus.conductors[3]),
+            (self.register.D2, self.bus.conductors[2]),
+            (self.register.D3, self.bus.conductors[1]),
+            (self.register.D4, self.bus.conductors[0]),
+        ))
 
     def _connect_register_output(self):
-        self.register.Q1.conductors.append(self.register_bus.conductors[3])
-        self.register.Q2.conductors.append(self.register_bus.conductors[2])
-        self.register.Q3.conductors.append(self.register_bus.conductors[1])
-        self.register.Q4.conductors.append(self.register_bus.conductors[0])
+        wire((
+            (self.register.Q1, self.register_bus.conductors[3]),
+            (self.register.Q2, self.register_bus.conductors[2]),
+            (self.register.Q3, self.register_bus.conductors[1]),
+            (self.register.Q4, self.register_bus.conductors[0]),
+        ))
 
     def evaluate(self):
-        self.register.evaluate()
+        for part in self.parts:
+            part.evaluate()
 
 
 class RamModule:
@@ -273,36 +269,45 @@ class RamModule:
         # RAM module itself
         self.ram = eater.part.Ram()
         connect_power(vcc, gnd, self.ram)
-        self.ram.CHIP_SELECT.conductors.append(gnd)
-        self.ram.OUTPUT_ENABLE.conductors.append(memory_out)
-        self.ram.A0.conductors.append(self.address_register.register_bus.conductors[0])
-        self.ram.A1.conductors.append(self.address_register.register_bus.conductors[1])
-        self.ram.A2.conductors.append(self.address_register.register_bus.conductors[2])
-        self.ram.A3.conductors.append(self.address_register.register_bus.conductors[3])
-        self.ram.IO0.conductors.append(bus.conductors[0])
-        self.ram.IO1.conductors.append(bus.conductors[1])
-        self.ram.IO2.conductors.append(bus.conductors[2])
-        self.ram.IO3.conductors.append(bus.conductors[3])
-        self.ram.IO4.conductors.append(bus.conductors[4])
-        self.ram.IO5.conductors.append(bus.conductors[5])
-        self.ram.IO6.conductors.append(bus.conductors[6])
-        self.ram.IO7.conductors.append(bus.conductors[7])
+        address = self.address_register.register_bus.conductors
+        wire((
+            (self.ram.CHIP_SELECT, gnd),
+            (self.ram.OUTPUT_ENABLE, memory_out),
+            (self.ram.A0, address[0]),
+            (self.ram.A1, address[1]),
+            (self.ram.A2, address[2]),
+            (self.ram.A3, address[3]),
+            (self.ram.IO0, bus.conductors[0]),
+            (self.ram.IO1, bus.conductors[1]),
+            (self.ram.IO2, bus.conductors[2]),
+            (self.ram.IO3, bus.conductors[3]),
+            (self.ram.IO4, bus.conductors[4]),
+            (self.ram.IO5, bus.conductors[5]),
+            (self.ram.IO6, bus.conductors[6]),
+            (self.ram.IO7, bus.conductors[7]),
+        ))
 
         # NAND gate used to select write enable when clock and memory input  are high.
         self.clk_nand = eater.part.QuadNandGate()
         connect_power(vcc, gnd, self.clk_nand)
-        self.clk_nand.A1.conductors.append(clk)
-        self.clk_nand.B1.conductors.append(memory_in)
-        self.clk_nand.Y1.conductors.append(self.ram.WRITE_ENABLE)
+        wire((
+            (self.clk_nand.A1, clk),
+            (self.clk_nand.B1, memory_in),
+            (self.clk_nand.Y1, self.ram.WRITE_ENABLE),
+        ))
+
+        self.parts = (self.clk_nand, self.address_register, self.ram)
 
     def evaluate(self):
-        self.clk_nand.evaluate()
-        self.address_register.evaluate()
-        self.ram.evaluate()
+        for part in self.parts:
+            part.evaluate()
 
     def fiddle(self, address: int, data: int):
         self.ram.fiddle(address, data)
 
+    def load(self, address: int, data: bytes):
+        self.ram.load(address, data)
+
 
 class ProgramCounter:
     def __init__(
@@ -320,38 +325,86 @@ class ProgramCounter:
         connect_power(vcc, gnd, self.trans)
         connect_power(vcc, gnd, self.counter)
 
-        self.counter.D1.conductors.append(bus.conductors[0])
-        self.counter.D2.conductors.append(bus.conductors[1])
-        self.counter.D3.conductors.append(bus.conductors[2])
-        self.counter.D4.conductors.append(bus.conductors[3])
+        wire((
+            (self.counter.D1, bus.conductors[0]),
+            (self.counter.D2, bus.conductors[1]),
+            (self.counter.D3, bus.conductors[2]),
+            (self.counter.D4, bus.conductors[3]),
 
-        self.counter.LOAD.conductors.append(jump)
-        self.counter.ENABLE_P.conductors.append(counter_enable)
-        self.counter.ENABLE_T.conductors.append(counter_enable)
-        self.counter.CLR.conductors.append(clr)
-        self.counter.CLK.conductors.append(clk)
+            (self.counter.LOAD, jump),
+            (self.counter.ENABLE_P, counter_enable),
+            (self.counter.ENABLE_T, counter_enable),
+            (self.counter.CLR, clr),
+            (self.counter.CLK, clk),
 
-        self.trans.B4.conductors.append(self.counter.Q4)
-        self.trans.B5.conductors.append(self.counter.Q3)
-        self.trans.B6.conductors.append(self.counter.Q2)
-        self.trans.B7.conductors.append(self.counter.Q1)
+            (self.trans.B4, self.counter.Q4),
+            (self.trans.B5, self.counter.Q3),
+            (self.trans.B6, self.counter.Q2),
+            (self.trans.B7, self.counter.Q1),
 
-        self.trans.ENABLED.conductors.append(counter_out)
-        self.trans.DIRECTION.conductors.append(gnd)
+            (self.trans.ENABLED, counter_out),
+            (self.trans.DIRECTION, gnd),
 
-        self.trans.A4.conductors.append(bus.conductors[3])
-        self.trans.A5.conductors.append(bus.conductors[2])
-        self.trans.A6.conductors.append(bus.conductors[1])
-        self.trans.A7.conductors.append(bus.conductors[0])
+            (self.trans.A4, bus.conductors[3]),
+            (self.trans.A5, bus.conductors[2]),
+            (self.trans.A6, bus.conductors[1]),
+            (self.trans.A7, bus.conductors[0]),
+        ))
+
+        self.parts = (self.counter, self.trans)
 
     def evaluate(self):
-        self.counter.evaluate()
-        self.trans.evaluate()
+        for part in self.parts:
+            part.evaluate()
 
     def __str__(self):
         return f"ProgramCounter(value={ self.counter.count })"
 
 
+class ZeroDetector(eater.part.Part):
+    """Drives its output high when both halves of an eight-bit sum are zero."""
+
+    def __init__(
+            self, low_adder: eater.part.FourBitAdder, high_adder: eater.part.FourBitAdder,
+            output: eater.part.Junction):
+        self.low_adder = low_adder
+        self.high_adder = high_adder
+        self._vs = eater.part.VoltageSource(False)
+        output.set(self._vs)
+
+    def evaluate(self):
+        self._vs.value = (self.low_adder.sum_value | self.high_adder.sum_value) == 0
+
+
+class FastAdder(eater.part.Part):
+    """
+    Computes a + (b XOR subtract) + subtract on packed buses and drives the result onto a pair of adders.
+
+    Stands in for the XOR gates and adders of the ALU without evaluating them gate by gate.
+    """
+
+    def __init__(
+            self,
+            a_bus: eater.part.Bus, b_bus: eater.part.Bus,
+            subtract: eater.part.Junction,
+            low_adder: eater.part.FourBitAdder, high_adder: eater.part.FourBitAdder):
+        self.a_bus = a_bus
+        self.b_bus = b_bus
+        self.subtract = subtract
+        self.low_adder = low_adder
+        self.high_adder = high_adder
+
+    def evaluate(self):
+        a = self.a_bus.int_value
+        b = self.b_bus.int_value
+        subtract = int(self.subtract.state or False)
+        if subtract:
+            b ^= 0xFF
+
+        self.low_adder.drive((a & 0b1111) + (b & 0b1111) + subtract)
+        self.high_adder.drive((a + b + subtract) >> 4)
+
+
 class Alu:
     def __init__(
             self,
@@ -364,7 +417,8 @@ class Alu:
             zero_out: eater.part.Junction,
             a_bus: eater.part.Bus,
             b_bus: eater.part.Bus,
-            bus: eater.part.Bus):
+            bus: eater.part.Bus,
+            fast: bool = False):
 
         self.low_adder = eater.part.FourBitAdder()
         self.high_adder = eater.part.FourBitAdder()
@@ -380,67 +434,71 @@ class Alu:
         connect_power(vcc, gnd, self.low_subtract_xor)
         connect_power(vcc, gnd, self.high_subtract_xor)
 
-        # Subtract line goes to carry in of low adder
-        self.low_adder.CARRY_IN.conductors.append(subtract)
-
-        # Connect carry bit of low register to carry in of high
-        self.low_adder.CARRY_OUT.conductors.append(self.high_adder.CARRY_IN)
-
-        # Carry bit of high register  goes into flags register.
-        self.high_adder.CARRY_OUT.conductors.append(self.flags_register.D1)
+        wire((
+            # Subtract line goes to carry in of low adder
+            (self.low_adder.CARRY_IN, subtract),
+            # Connect carry bit of low register to carry in of high
+            (self.low_adder.CARRY_OUT, self.high_adder.CARRY_IN),
+            # Carry bit of high register  goes into flags register.
+            (self.high_adder.CARRY_OUT, self.flags_register.D1),
+        ))
 
         # Handle zero bit in software for the moment, instead of wiring up logic chips
-        self._zero_bit = eater.part.VoltageSource(False)
-        self.flags_register.D2.set(self._zero_bit)
-
-        # Always enable flag output gates
-        self.flags_register.N.conductors.append(gnd)
-        self.flags_register.M.conductors.append(gnd)
-        # Connect flags enable to flags_in
-        self.flags_register.G1.conductors.append(flags_in)
-        self.flags_register.G2.conductors.append(flags_in)
-        # Connect clock and clear lines
-        self.flags_register.CLK.conductors.append(clk)
-        self.flags_register.CLR.conductors.append(clr)
+        self.zero_detector = ZeroDetector(self.low_adder, self.high_adder, self.flags_register.D2)
+
+        # Always enable flag output gates, and latch flags on the clock when flags_in is low
+        connect_register_controls(gnd, clr, clk, flags_in, self.flags_register)
         # Connect flag output lines
-        self.flags_register.Q1.conductors.append(carry_out)
-        self.flags_register.Q2.conductors.append(zero_out)
+        wire((
+            (self.flags_register.Q1, carry_out),
+            (self.flags_register.Q2, zero_out),
+        ))
 
         # Connect subtract control line and B register output to xor gates
         xor_gates = self.low_subtract_xor.gates + self.high_subtract_xor.gates
         for gate, bus_line in zip(xor_gates, b_bus.conductors):
-            gate.inputs[0].conductors.append(bus_line)
-            gate.inputs[1].conductors.append(subtract)
+            wire((
+                (gate.inputs[0], bus_line),
+                (gate.inputs[1], subtract),
+            ))
 
         # Connect output of xor gate (register b, possibly inverted xorwise)
-        for gate, adder_in in zip(xor_gates, self.low_adder.b + self.high_adder.b):
-            gate.output.conductors.append(adder_in)
+        wire((gate.output, adder_in) for gate, adder_in in zip(xor_gates, self.low_adder.b + self.high_adder.b))
 
         # Connect a inputs of adders to output of register a
-        for bus_conductor, adder_in in zip(a_bus.conductors, self.low_adder.a + self.high_adder.a):
-            bus_conductor.conductors.append(adder_in)
+        wire(zip(a_bus.conductors, self.low_adder.a + self.high_adder.a))
 
         # Connect adder outputs to bus transceiver
-        for (trans_in, _), (adder_out, _) in zip(self.trans.a, self.low_adder.sum + self.high_adder.sum):
-            trans_in.conductors.append(adder_out)
+        wire(
+            (trans_in, adder_out)
+            for (trans_in, _), (adder_out, _) in zip(self.trans.a, self.low_adder.sum + self.high_adder.sum)
+        )
 
         # Connect control lines to transceiver
-        self.trans.DIRECTION.conductors.append(vcc)
-        self.trans.ENABLED.conductors.append(result_out)
+        wire((
+            (self.trans.DIRECTION, vcc),
+            (self.trans.ENABLED, result_out),
+        ))
 
         # Connect transceiver outputs to bus
         self.trans.set_bus_b(bus)
 
+        # In fast mode the XOR gates and adders are replaced by integer arithmetic on the packed buses.
+        if fast:
+            self.fast_adder = FastAdder(a_bus, b_bus, subtract, self.low_adder, self.high_adder)
+            adder_parts = (self.fast_adder,)
+        else:
+            adder_parts = (self.low_subtract_xor, self.high_subtract_xor, self.low_adder, self.high_adder)
+
+        self.parts = adder_parts + (self.trans, self.zero_detector, self.flags_register)
+
     def evaluate(self):
-        self.low_subtract_xor.evaluate()
-        self.high_subtract_xor.evaluate()
-        self.low_adder.evaluate()
-        self.high_adder.evaluate()
-        self.trans.evaluate()
+        for part in self.parts:
+            part.evaluate()
 
-        is_zero = not any([pin.state for pin, _ in self.low_adder.sum + self.high_adder.sum])
-        self._zero_bit.value = is_zero
-        self.flags_register.evaluate()
+
+# Output lines for every possible byte, formatted once rather than on every clock.
+_OUTPUT_LINES = tuple(f"Output: {value}\t{bin(value)}\t{hex(value)}\n" for value in range(256))
 
 
 class Output:
@@ -449,12 +507,20 @@ class Output:
             self,
             clk: eater.part.Junction, clr: eater.part.Junction,
             output_enable: eater.part.Junction,
-            bus: eater.part.Bus):
+            bus: eater.part.Bus,
+            stream: Optional[TextIO] = None):
         self.clk = clk
         self.clr = clr
         self.output_enable = output_enable
         self.bus = bus
         self.value = 0
+        # Defaults to whatever sys.stdout is at the time of writing.
+        self.stream = stream
+
+    @property
+    def writing(self) -> bool:
+        """Whether the next evaluation writes to the stream. A line is written on every evaluation while clocked."""
+        return bool(self.clk.state and self.output_enable.state) and not self.clr.state
 
     def evaluate(self):
         if self.clr.state:
@@ -462,31 +528,61 @@ class Output:
             return
 
         if self.clk.state and self.output_enable.state:
-            self.value = eater.part.list_to_int([i or False for i in self.bus.value])
-            print(f"Output: {self.value}\t{bin(self.value)}\t{hex(self.value)}")
+            self.value = self.bus.int_value
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write(_OUTPUT_LINES[self.value])
 
 
-class Control:
-    def parse_mnemonic(self, line) -> Tuple[str, str]:
+# Opcodes occupy the upper four bits of an instruction, and the operand the lower four.
+OPCODES = {
+    "LDA": 0b0000,
+    "ADD": 0b0001,
+    "OUT": 0b1110,
+}
+
+
+def _encode(opcode: int, operand: int) -> int:
+    """Pack an instruction into a byte, raising ValueError if either half does not fit in four bits."""
+    if not 0 <= opcode <= 0b1111:
+        raise ValueError(f"Opcode {opcode} out of range 0-15.")
+    if not 0 <= operand <= 0b1111:
+        raise ValueError(f"Operand {operand} out of range 0-15.")
+    return (opcode << 4) | operand
+
+
+def _parse_program(program: str) -> Tuple[Tuple[int, int], ...]:
+    """Parse assembly source into (opcode, operand) pairs. Instructions without an operand get zero."""
+    instructions = []
+    for line in program.splitlines():
         split = line.strip().split()
-        instruction = split[0]
-        param = split[1] if len(split) > 1 else None
-        return instruction, param
+        if not split:
+            continue
+        mnemonic = split[0]
+        if mnemonic not in OPCODES:
+            raise ValueError(f"Unknown instruction: {mnemonic}")
+        opcode = OPCODES[mnemonic]
+        operand = int(split[1]) if len(split) > 1 else 0
+        # Encoding raises if the operand does not fit alongside the opcode.
+        _encode(opcode, operand)
+        instructions.append((opcode, operand))
+    return tuple(instructions)
+
 
+class Control:
     program = """\
     LDA 14
     ADD 15
     OUT
     """
+    PROGRAM = _parse_program(program)
+
+    def load_program(self, program: Tuple[Tuple[int, int], ...] = PROGRAM):
+        """Write parsed instructions into RAM, starting at address zero."""
+        self.ram.load(0, bytes(_encode(opcode, operand) for opcode, operand in program))
 
     def eval_all(self):
-        self.pc.evaluate()
-        self.ram.evaluate()
-        self.instruction_register.evaluate()
-        self.alu.evaluate()
-        self.register_a.evaluate()
-        self.register_b.evaluate()
-        self.output.evaluate()
+        for evaluate in self._schedule:
+            evaluate()
 
     def do_clock(self, num_times=2):
         """
@@ -497,38 +593,61 @@ class Control:
         """
         self.clk.on()
         self.not_clk.off()
-
-        for _ in range(num_times):
-            self.eval_all()
+        self._settle(num_times)
 
         self.clk.off()
         self.not_clk.on()
+        self._settle(num_times)
+
+    def _settle(self, num_times: int):
+        """
+        Sweep up to num_times, stopping early once a sweep changes nothing.
+
+        A sweep that leaves every logic level unchanged starts the next sweep from the same state, so the next sweep
+        would do the same thing again. The exception is the output, which writes a line on every sweep while it is
+        clocked, so every requested sweep is run while it is writing.
 
+        Every module both reads and drives the shared bus, so the modules form a single feedback loop. There is no
+        loop-free part of the computer to evaluate once and set aside, and the whole sweep is iterated instead.
+        """
         for _ in range(num_times):
+            activity = eater.part.activity()
             self.eval_all()
+            if eater.part.activity() == activity and not self.output.writing:
+                return
+
+    # Control lines in bit order, paired with their level when every module is disabled. Most are active low.
+    CONTROL_LINES = (
+        ("clk", False),
+        ("clr", False),
+        ("not_clk", True),
+        ("not_clr", True),
+        ("address_in", True),
+        ("memory_in", False),
+        ("memory_out", True),
+        ("instruction_out", True),
+        ("instruction_in", True),
+        ("counter_enable", False),
+        ("counter_out", True),
+        ("jump", True),
+        ("result_out", True),
+        ("subtract", False),
+        ("flags_in", True),
+        ("b_in", True),
+        ("b_out", True),
+        ("a_in", True),
+        ("a_out", True),
+        ("output_enable", False),
+    )
+    DISABLED_WORD = sum(1 << bit for bit, (_, level) in enumerate(CONTROL_LINES) if level)
+
+    def set_control_word(self, word: int):
+        """Set every control line at once from a word packed in CONTROL_LINES order."""
+        for bit, line in enumerate(self._control_lines):
+            line.vs.value = bool(word & (1 << bit))
 
     def disable_all(self):
-        self.clk.off()
-        self.clr.off()
-        self.not_clk.on()
-        self.not_clr.on()
-
-        self.address_in.on()
-        self.memory_in.off()
-        self.memory_out.on()
-        self.instruction_out.on()
-        self.instruction_in.on()
-        self.counter_enable.off()
-        self.counter_out.on()
-        self.jump.on()
-        self.result_out.on()
-        self.subtract.off()
-        self.flags_in.on()
-        self.b_in.on()
-        self.b_out.on()
-        self.a_in.on()
-        self.a_out.on()
-        self.output_enable.off()
+        self.set_control_word(self.DISABLED_WORD)
 
     def fetch(self):
         # Enable counter output and address input
@@ -610,9 +729,9 @@ class Control:
         self.output_enable.off()
 
 
-    def __init__(self):
-        self.vcc = eater.part.PoweredJunction(True)
-        self.gnd = eater.part.PoweredJunction(False)
+    def __init__(self, fast_mode: bool = False):
+        self.vcc = eater.part.PoweredJunction(True, constant=True)
+        self.gnd = eater.part.PoweredJunction(False, constant=True)
 
         self.clk = eater.part.PoweredJunction(False)
         self.clr = eater.part.PoweredJunction(False)
@@ -640,6 +759,7 @@ class Control:
         self.counter_out = eater.part.PoweredJunction(True)
         self.counter_enable = eater.part.PoweredJunction(True)
         self.jump = eater.part.PoweredJunction(True)
+        self._control_lines = tuple(getattr(self, name) for name, _ in self.CONTROL_LINES)
         self.disable_all()
 
         self.bus = eater.part.Bus([eater.part.Junction() for _ in range(8)])
@@ -651,5 +771,18 @@ class Control:
         self.output = Output(self.clk, self.clr, self.output_enable, self.bus)
 
         self.ram = RamModule(self.vcc, self.gnd, self.clr, self.clk, self.address_in, self.memory_in, self.memory_out, self.bus)
-        self.alu = Alu(self.vcc, self.gnd, self.clr, self.clk, self.result_out, self.subtract, self.flags_in, self.carry_out, self.zero_out, self.register_a.register_bus, self.register_b.register_bus, self.bus)
+        self.alu = Alu(self.vcc, self.gnd, self.clr, self.clk, self.result_out, self.subtract, self.flags_in, self.carry_out, self.zero_out, self.register_a.register_bus, self.register_b.register_bus, self.bus, fast=fast_mode)
         self.pc = ProgramCounter(self.vcc, self.gnd, self.not_clr, self.clk, self.counter_out, self.counter_enable, self.jump, self.bus)
+
+        # Evaluation order is resolved once, rather than on every sweep. The registers are level-sensitive latches,
+        # so the order matters: the ALU must drive the bus before register A latches the result.
+        self.modules = (
+            self.pc,
+            self.ram,
+            self.instruction_register,
+            self.alu,
+            self.register_a,
+            self.register_b,
+            self.output,
+        )
+        self._schedule = _schedule(self.modules)
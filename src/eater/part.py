@@ -21,6 +21,10 @@ def _bit_str(value: Optional[bool]) -> str:
         return '0'
 
 
+# Characters for each junction state, as _bit_str formats them.
+_STATE_CHARS = {None: 'x', False: '0', True: '1'}
+
+
 def list_to_int(values: List[bool]) -> int:
     value = 0
     for i, bit in enumerate(values):
@@ -36,19 +40,35 @@ def int_to_list(value: int, bits: int) -> List[bool]:
     return out
 
 
+# Bits of every 4-bit and 8-bit value, least significant first.
+_NIBBLE_BITS = tuple(tuple(int_to_list(value, 4)) for value in range(16))
+_BYTE_BITS = tuple(tuple(int_to_list(value, 8)) for value in range(256))
+
+
 class Bus:
+    __slots__ = ("conductors", "voltage_sources")
+
     def __init__(self, conductors: List[Junction]):
         self.conductors = conductors
         self.voltage_sources = [VoltageSource(False) for _ in conductors]
 
     def __str__(self):
-        bit_str = "".join([_bit_str(i.state) for i in self.conductors])
+        bit_str = "".join([_STATE_CHARS[c.state] for c in self.conductors])
         return f"Bus({bit_str})"
 
     @property
     def value(self) -> List[Optional[bool]]:
         return [c.state for c in self.conductors]
 
+    @property
+    def int_value(self) -> int:
+        """Value of the bus packed into an integer, least significant line first. Floating lines read as low."""
+        value = 0
+        for i, conductor in enumerate(self.conductors):
+            if conductor.state:
+                value |= (1 << i)
+        return value
+
     def pull_to(self, value: List[Optional[bool]]):
         for val, c, vs in zip(value, self.conductors, self.voltage_sources):
             if val is None:
@@ -57,79 +77,246 @@ class Bus:
                 vs.value = val
                 c.set(vs)
 
+    def pack(self) -> Tuple[int, int]:
+        """
+        Pack the bus into a pair of integers, least significant line first.
+
+        The first holds the lines that are high and the second the lines that are driven at all.
+        """
+        bits = 0
+        valid = 0
+        for i, conductor in enumerate(self.conductors):
+            state = conductor.state
+            if state is not None:
+                valid |= (1 << i)
+                if state:
+                    bits |= (1 << i)
+        return bits, valid
+
+    def unpack(self, bits: int, valid: int):
+        """Pull the bus to a packed value. Lines not set in valid are left floating."""
+        for i, (c, vs) in enumerate(zip(self.conductors, self.voltage_sources)):
+            if valid & (1 << i):
+                vs.value = bits & (1 << i) != 0
+                c.set(vs)
+            else:
+                c.clear(vs)
+
+
+# Incremented whenever a voltage source changes level, or is connected to or removed from a junction.
+_activity = 0
+
+
+def _active():
+    global _activity
+    _activity += 1
+
+
+def activity() -> int:
+    """Counter that changes whenever any logic level in the simulation may have changed."""
+    return _activity
+
 
 class VoltageSource:
+    __slots__ = ("_value",)
+
     def __init__(self, value: bool):
-        self.value = value
+        self._value = value
+
+    @property
+    def value(self) -> bool:
+        return self._value
+
+    @value.setter
+    def value(self, value: bool):
+        if value != self._value:
+            self._value = value
+            _active()
 
     def __str__(self):
-        return f"VoltageSource({_bit_str(self.value)})"
+        return f"{type(self).__name__}({_bit_str(self.value)})"
+
+
+# Incremented whenever any junction is rewired, invalidating every cached net.
+_wiring_version = 0
+
+
+def _rewired():
+    global _wiring_version
+    _wiring_version += 1
+
+
+def _rewires(method):
+    """Wrap a list method so that calling it invalidates cached nets."""
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        _rewired()
+        return result
+    return wrapper
+
+
+class Conductors(list):
+    """List of connected junctions that invalidates cached nets whenever it is modified."""
+    append = _rewires(list.append)
+    extend = _rewires(list.extend)
+    insert = _rewires(list.insert)
+    remove = _rewires(list.remove)
+    pop = _rewires(list.pop)
+    clear = _rewires(list.clear)
+    __setitem__ = _rewires(list.__setitem__)
+    __delitem__ = _rewires(list.__delitem__)
+    __iadd__ = _rewires(list.__iadd__)
 
 
 class Junction:
+    __slots__ = ("_sources", "_conductors", "_net", "_net_version", "_state", "_state_activity", "_state_version")
+
     def __init__(self, conductors: List[Junction] = None):
         self._sources: Set[VoltageSource] = set()
         self.conductors = conductors if conductors is not None else []
+        self._net: Tuple[Junction, ...] = ()
+        self._net_version = -1
+        self._state: Optional[bool] = None
+        self._state_activity = -1
+        self._state_version = -1
 
     @property
-    def state(self) -> Optional[bool]:
-        logic_levels = [s.value for s in self._sources] + [c.state for c in self.conductors if c.state is not None]
-        if not logic_levels:
-            return None
-
-        all_1 = all(logic_levels)
-        all_0 = not any(logic_levels)
-
-        if not (all_1 or all_0):
-            raise ValueError("Conductors have different logic levels.")
+    def conductors(self) -> Conductors:
+        return self._conductors
+
+    @conductors.setter
+    def conductors(self, conductors: List[Junction]):
+        self._conductors = Conductors(conductors)
+        _rewired()
+
+    def net(self) -> Tuple[Junction, ...]:
+        """
+        Flatten the conductor graph reachable from this junction, visiting each junction once.
+
+        The state of a junction depends on the voltage sources of every junction in its net. The flattened net is
+        cached until any junction is rewired.
+        """
+        if self._net_version == _wiring_version:
+            return self._net
+
+        net = []
+        seen = set()
+        stack = [self]
+        while stack:
+            junction = stack.pop()
+            if id(junction) in seen:
+                continue
+            seen.add(id(junction))
+            net.append(junction)
+            stack.extend(junction.conductors)
+
+        self._net = tuple(net)
+        self._net_version = _wiring_version
+        return self._net
 
-        return all_1
+    @property
+    def state(self) -> Optional[bool]:
+        # Nothing can have changed the state unless there has been activity or rewiring since it was last read.
+        if self._state_activity == _activity and self._state_version == _wiring_version:
+            return self._state
+
+        high = False
+        low = False
+        for junction in self.net():
+            for source in junction._sources:
+                if source._value:
+                    high = True
+                else:
+                    low = True
+            if high and low:
+                raise ValueError("Conductors have different logic levels.")
+
+        self._state = high if (high or low) else None
+        self._state_activity = _activity
+        self._state_version = _wiring_version
+        return self._state
 
     def set(self, source: VoltageSource):
-        self._sources.add(source)
-        for conductor in self.conductors:
-            conductor.set(source)
+        """Connect a voltage source to this junction and every junction downstream of it."""
+        for junction in self.net():
+            if source not in junction._sources:
+                junction._sources.add(source)
+                _active()
 
     def clear(self, source: Any):
-        if source in self._sources:
-            self._sources.remove(source)
-
-        for conductor in self.conductors:
-            conductor.clear(source)
+        """Disconnect a voltage source from this junction and every junction downstream of it."""
+        for junction in self.net():
+            if source in junction._sources:
+                junction._sources.remove(source)
+                _active()
 
     def __str__(self):
-        return f"Junction({_bit_str(self.state)})"
+        return f"Junction({_STATE_CHARS[self.state]})"
 
 
 class PoweredJunction(Junction):
-    def __init__(self, initial: bool):
+    __slots__ = ("vs", "constant")
+
+    def __init__(self, initial: bool, constant: bool = False):
         super().__init__()
         self.vs = VoltageSource(initial)
         self.set(self.vs)
+        # Constant junctions are power rails that never change during a simulation.
+        self.constant = constant
 
     def on(self):
+        if self.constant:
+            raise ValueError("Cannot switch a constant junction.")
         self.vs.value = True
         self.set(self.vs)
 
     def off(self):
+        if self.constant:
+            raise ValueError("Cannot switch a constant junction.")
         self.vs.value = False
         self.set(self.vs)
 
 
+def _is_constant(junction: Junction) -> bool:
+    """Whether a junction is only ever driven by constant power rails."""
+    rails = 0
+    for j in junction.net():
+        if isinstance(j, PoweredJunction) and j.constant:
+            rails += 1
+        elif j._sources:
+            return False
+    return rails > 0
+
+
 class Pin(Junction):
+    __slots__ = ("pin_number",)
+
     def __init__(self, pin_number: int, conductors: List[Junction] = None):
         super().__init__(conductors)
         self.pin_number = pin_number
 
     def __str__(self):
-        return f"Pin({_bit_str(self.state)})"
+        return f"Pin({_STATE_CHARS[self.state]})"
+
 
+class Gate(VoltageSource, abc.ABC):
+    """Logic gate. The gate is itself the voltage source that drives its output pin."""
+    __slots__ = ("inputs", "output", "_driven_version")
 
-class Gate(abc.ABC):
     def __init__(self, inputs: List[Pin], output: Pin):
+        super().__init__(False)
         self.inputs = inputs
         self.output = output
-        self._voltage_source = VoltageSource(False)
+        # Wiring version at which the output was last driven, or -1 if it never has been.
+        self._driven_version = -1
+
+    def _drive(self, value: bool):
+        """Drive the output, unless it already carries this level over the current wiring."""
+        if value == self._value and self._driven_version == _wiring_version:
+            return
+        self.value = value
+        self.output.set(self)
+        self._driven_version = _wiring_version
 
     @abc.abstractmethod
     def evaluate(self):
@@ -137,43 +324,91 @@ class Gate(abc.ABC):
 
 
 class NandGate(Gate):
+    __slots__ = ()
+
     def evaluate(self):
-        self._voltage_source.value = not all([i.state for i in self.inputs])
-        self.output.set(self._voltage_source)
+        self._drive(not all([i.state for i in self.inputs]))
 
 
 class NorGate(Gate):
+    __slots__ = ()
+
     def evaluate(self):
-        self._voltage_source.value = not any([i.state for i in self.inputs])
-        self.output.set(self._voltage_source)
+        self._drive(not any([i.state for i in self.inputs]))
 
 
 class NotGate(Gate):
+    __slots__ = ()
+
+    def __init__(self, inputs: List[Pin], output: Pin):
+        assert len(inputs) == 1, "Not gate must have a single input."
+        super().__init__(inputs, output)
+
     def evaluate(self):
-        assert len(self.inputs) == 1, "Not gate must have a single input."
-        self._voltage_source.value = not self.inputs[0].state
-        self.output.set(self._voltage_source)
+        self._drive(not self.inputs[0].state)
 
 
 class AndGate(Gate):
+    __slots__ = ()
+
     def evaluate(self):
-        self._voltage_source.value = all([i.state for i in self.inputs])
-        self.output.set(self._voltage_source)
+        self._drive(all([i.state for i in self.inputs]))
 
 
 class OrGate(Gate):
+    __slots__ = ()
+
     def evaluate(self):
-        self._voltage_source.value = any([i.state for i in self.inputs])
-        self.output.set(self._voltage_source)
+        self._drive(any([i.state for i in self.inputs]))
 
 
 class XorGate(Gate):
+    __slots__ = ()
+
+    def __init__(self, inputs: List[Pin], output: Pin):
+        assert len(inputs) == 2, "XOR gate must have two inputs."
+        super().__init__(inputs, output)
+
+    def evaluate(self):
+        self._drive(bool(self.inputs[0].state) ^ bool(self.inputs[1].state))
+
+
+class TwoInputGate(Gate, abc.ABC):
+    """Gate with exactly two inputs, held separately so evaluation needs no list of input states."""
+    __slots__ = ("a", "b")
+
+    def __init__(self, inputs: List[Pin], output: Pin):
+        assert len(inputs) == 2, "Gate must have two inputs."
+        super().__init__(inputs, output)
+        self.a, self.b = inputs
+
+
+class TwoInputNandGate(TwoInputGate):
+    __slots__ = ()
+
+    def evaluate(self):
+        self._drive(not (self.a.state and self.b.state))
+
+
+class TwoInputNorGate(TwoInputGate):
+    __slots__ = ()
+
+    def evaluate(self):
+        self._drive(not (self.a.state or self.b.state))
+
+
+class TwoInputAndGate(TwoInputGate):
+    __slots__ = ()
+
     def evaluate(self):
-        assert len(self.inputs) == 2, "XOR gate must have two inputs."
-        a = int(self.inputs[0].state or False)
-        b = int(self.inputs[1].state or False)
-        self._voltage_source.value = bool(a ^ b)
-        self.output.set(self._voltage_source)
+        self._drive(bool(self.a.state and self.b.state))
+
+
+class TwoInputOrGate(TwoInputGate):
+    __slots__ = ()
+
+    def evaluate(self):
+        self._drive(bool(self.a.state or self.b.state))
 
 
 class Part(abc.ABC):
@@ -187,25 +422,43 @@ class PoweredPart(Part, abc.ABC):
         super().__init__(*args, **kwargs)
         self.VCC = vcc
         self.GND = gnd
+        # Wiring version at which VCC and GND were last found to be tied to constant rails.
+        self._constant_power_version = -1
 
     def evaluate(self):
         super().evaluate()
-        assert self.VCC.state, "VCC is not high."
-        assert not self.GND.state, "GND is not low."
+        # Power is only checked when assertions are enabled. While it is tied to constant rails it can only change if
+        # the chip is rewired.
+        if __debug__ and self._constant_power_version != _wiring_version:
+            assert self.VCC.state, "VCC is not high."
+            assert not self.GND.state, "GND is not low."
+            if _is_constant(self.VCC) and _is_constant(self.GND):
+                self._constant_power_version = _wiring_version
 
 
 class LogicPart(Part, abc.ABC):
     def __init__(self, *args, gates: List[Gate], **kwargs):
         super().__init__(*args, **kwargs)
         self.gates = gates
+        # Gates on a chip share no internal wiring, so any order is a valid evaluation order.
+        self._gate_evaluators = tuple(gate.evaluate for gate in gates)
+        self._gate_inputs = tuple(pin for gate in gates for pin in gate.inputs)
+        self._last_inputs = None
 
     def evaluate(self):
         super().evaluate()
-        for gate in self.gates:
-            gate.evaluate()
 
+        # Gates are combinational, so if no input has changed since the last evaluation neither has any output.
+        inputs = (tuple([pin.state for pin in self._gate_inputs]), _wiring_version)
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
+
+        for evaluate in self._gate_evaluators:
+            evaluate()
 
-class QuadNandGate(LogicPart, PoweredPart):
+
+class QuadNandGate(PoweredPart, LogicPart):
     """
     74LS00 Quad 2-Input Positive NAND Gate DIP-14
 
@@ -230,10 +483,10 @@ class QuadNandGate(LogicPart, PoweredPart):
         self.B4 = Pin(13)
 
         gates = [
-            NandGate([self.A1, self.B1], self.Y1),
-            NandGate([self.A2, self.B2], self.Y2),
-            NandGate([self.A3, self.B3], self.Y3),
-            NandGate([self.A4, self.B4], self.Y4),
+            TwoInputNandGate([self.A1, self.B1], self.Y1),
+            TwoInputNandGate([self.A2, self.B2], self.Y2),
+            TwoInputNandGate([self.A3, self.B3], self.Y3),
+            TwoInputNandGate([self.A4, self.B4], self.Y4),
         ]
 
         super().__init__(vcc=Pin(14), gnd=Pin(7), gates=gates)
@@ -264,10 +517,10 @@ class QuadNorGate(PoweredPart, LogicPart):
         self.Y4 = Pin(13)
 
         gates = [
-            NorGate([self.A1, self.B1], self.Y1),
-            NorGate([self.A2, self.B2], self.Y2),
-            NorGate([self.A3, self.B3], self.Y3),
-            NorGate([self.A4, self.B4], self.Y4),
+            TwoInputNorGate([self.A1, self.B1], self.Y1),
+            TwoInputNorGate([self.A2, self.B2], self.Y2),
+            TwoInputNorGate([self.A3, self.B3], self.Y3),
+            TwoInputNorGate([self.A4, self.B4], self.Y4),
         ]
         super().__init__(vcc=Pin(14), gnd=Pin(7), gates=gates)
 
@@ -334,10 +587,10 @@ class QuadAndGate(PoweredPart, LogicPart):
         self.B4 = Pin(13)
 
         gates = [
-            AndGate([self.A1, self.B1], self.Y1),
-            AndGate([self.A2, self.B2], self.Y2),
-            AndGate([self.A3, self.B3], self.Y3),
-            AndGate([self.A4, self.B4], self.Y4),
+            TwoInputAndGate([self.A1, self.B1], self.Y1),
+            TwoInputAndGate([self.A2, self.B2], self.Y2),
+            TwoInputAndGate([self.A3, self.B3], self.Y3),
+            TwoInputAndGate([self.A4, self.B4], self.Y4),
         ]
         super().__init__(vcc=Pin(14), gnd=Pin(7), gates=gates)
 
@@ -367,10 +620,10 @@ class QuadOrGate(PoweredPart, LogicPart):
         self.B4 = Pin(13)
 
         gates = [
-            OrGate([self.A1, self.B1], self.Y1),
-            OrGate([self.A2, self.B2], self.Y2),
-            OrGate([self.A3, self.B3], self.Y3),
-            OrGate([self.A4, self.B4], self.Y4),
+            TwoInputOrGate([self.A1, self.B1], self.Y1),
+            TwoInputOrGate([self.A2, self.B2], self.Y2),
+            TwoInputOrGate([self.A3, self.B3], self.Y3),
+            TwoInputOrGate([self.A4, self.B4], self.Y4),
         ]
         super().__init__(vcc=Pin(14), gnd=Pin(7), gates=gates)
 
@@ -444,6 +697,15 @@ class OctalBusTransceiver(PoweredPart):
         self.a = [(pin, VoltageSource(False)) for pin in a_pins]
         self.b = [(pin, VoltageSource(False)) for pin in b_pins]
 
+        # Input and output pin pairs for each direction, keyed on the state of the direction pin.
+        self._transfers = {
+            True: tuple((in_pin, out_pin, out_vs) for (in_pin, _), (out_pin, out_vs) in zip(self.a, self.b)),
+            False: tuple((in_pin, out_pin, out_vs) for (in_pin, _), (out_pin, out_vs) in zip(self.b, self.a)),
+        }
+        self._outputs = tuple(self.a + self.b)
+        # Direction, input levels and wiring version last driven onto the outputs, or None while nothing is driven.
+        self._driven: Optional[Tuple[bool, Tuple[Optional[bool], ...], int]] = None
+
     def _connect_bus(self, bus: Bus, pins: List[Tuple[Pin, VoltageSource]]):
         for conductor, (pin, _) in zip(bus.conductors, pins):
             pin.conductors.append(conductor)
@@ -459,22 +721,27 @@ class OctalBusTransceiver(PoweredPart):
 
         # Disable outputs when enable is high
         if self.ENABLED.state:
-            for pin, voltage in self.a + self.b:
-                pin.clear(voltage)
+            # Outputs are only ever driven while enabled, so once cleared they stay clear.
+            if self._driven is not None:
+                for pin, voltage in self._outputs:
+                    pin.clear(voltage)
+                self._driven = None
             return
 
         direction = self.DIRECTION.state
         if direction is None:
             raise ValueError("Direction pin not tied high or low.")
-        elif direction:
-            inputs = self.a
-            outputs = self.b
-        else:
-            inputs = self.b
-            outputs = self.a
 
-        for (in_pin, in_vs), (out_pin, out_vs) in zip(inputs, outputs):
-            out_vs.value = in_pin.state
+        transfers = self._transfers[direction]
+        levels = tuple([in_pin.state for in_pin, _, _ in transfers])
+        driven = (direction, levels, _wiring_version)
+        # The outputs already carry these levels, so there is nothing to push downstream.
+        if driven == self._driven:
+            return
+        self._driven = driven
+
+        for (_, out_pin, out_vs), level in zip(transfers, levels):
+            out_vs.value = level
             out_pin.set(out_vs)
 
     def __str__(self):
@@ -513,8 +780,13 @@ class FourBitDRegister(PoweredPart):
             (self.D3, self.Q3, VoltageSource(False)),
             (self.D4, self.Q4, VoltageSource(False)),
         ]
+        self._inputs = tuple(d for d, _, _ in self.lines)
+        self._outputs = tuple((q, vs) for _, q, vs in self.lines)
 
-        self._state = [False] * 4
+        # Latched bits packed into an int, D1 in the least significant bit. Bits of _valid are clear where a floating
+        # input was latched.
+        self._state = 0
+        self._valid = 0b1111
         self._last_clock = False
 
     def evaluate(self):
@@ -522,17 +794,17 @@ class FourBitDRegister(PoweredPart):
 
         # # We only react on the rising edge, so keep track of the clock state.
         # last_clock = self._last_clock
-        clock = self.CLK.state
-        # self._last_clock = clock
+        # self._last_clock = self.CLK.state
 
         # If either gate control pin is high, output is enabled.
         if self.N.state or self.M.state:
-            for _, out_pin, vs in self.lines:
+            for out_pin, vs in self._outputs:
                 out_pin.clear(vs)
 
         # If the clear pin is high, reset the state to zero.
         if self.CLR.state:
-            self._state = [False] * 4
+            self._state = 0
+            self._valid = 0b1111
             self._set_outputs()
             return
 
@@ -541,17 +813,32 @@ class FourBitDRegister(PoweredPart):
             return
 
         # On a rising edge, latch in the data bits.
-        if clock: # and not last_clock:
-            self._state = [d.state for d, _, _ in self.lines]
+        if self.CLK.state: # and not last_clock:
+            d1, d2, d3, d4 = self._inputs
+            s1, s2, s3, s4 = d1.state, d2.state, d3.state, d4.state
+            self._state = bool(s1) | bool(s2) << 1 | bool(s3) << 2 | bool(s4) << 3
+            self._valid = (
+                (s1 is not None) | (s2 is not None) << 1 | (s3 is not None) << 2 | (s4 is not None) << 3
+            )
             self._set_outputs()
 
     def _set_outputs(self):
-        for (_, q, vs), data_bit in zip(self.lines, self._state):
-            vs.value = data_bit
-            q.set(vs)
+        (q1, vs1), (q2, vs2), (q3, vs3), (q4, vs4) = self._outputs
+        bit1, bit2, bit3, bit4 = _NIBBLE_BITS[self._state]
+        vs1.value = bit1
+        q1.set(vs1)
+        vs2.value = bit2
+        q2.set(vs2)
+        vs3.value = bit3
+        q3.set(vs3)
+        vs4.value = bit4
+        q4.set(vs4)
 
-    def value(self) -> List[bool]:
-        return self._state
+    def value(self) -> List[Optional[bool]]:
+        return [
+            bit if valid else None
+            for bit, valid in zip(_NIBBLE_BITS[self._state], _NIBBLE_BITS[self._valid])
+        ]
 
     def __str__(self):
         bit_str = "".join([_bit_str(i) for i in self.value()])
@@ -623,7 +910,7 @@ class Ram(PoweredPart):
             (self.IO7, VoltageSource(False)),
         ]
 
-        self._memory = [0] * (2**15)
+        self._memory = bytearray(2**15)
 
     def _high_z(self):
         for pin, vs in self.io_lines:
@@ -649,7 +936,7 @@ class Ram(PoweredPart):
         # Inverted
         if not self.OUTPUT_ENABLE.state:
             address = list_to_int([pin.state for pin in self.address_lines])
-            data = int_to_list(self._memory[address], 8)
+            data = _BYTE_BITS[self._memory[address]]
             for (pin, vs), bit in zip(self.io_lines, data):
                 vs.value = bit
                 pin.set(vs)
@@ -660,6 +947,10 @@ class Ram(PoweredPart):
     def fiddle(self, address: int, data: int):
         self._memory[address] = data
 
+    def load(self, address: int, data: bytes):
+        """Copy a block of bytes into memory starting at address."""
+        self._memory[address:address + len(data)] = data
+
 
 class BinaryCounter(PoweredPart):
     """
@@ -702,10 +993,16 @@ class BinaryCounter(PoweredPart):
         super().__init__(vcc=Pin(16), gnd=Pin(8))
 
     def _write_count(self):
-        bits = int_to_list(self.count, 4)
-        for (pin, vs), bit in zip(self.outputs, bits):
-            vs.value = bit
-            pin.set(vs)
+        (q1, vs1), (q2, vs2), (q3, vs3), (q4, vs4) = self.outputs
+        bit1, bit2, bit3, bit4 = _NIBBLE_BITS[self.count]
+        vs1.value = bit1
+        q1.set(vs1)
+        vs2.value = bit2
+        q2.set(vs2)
+        vs3.value = bit3
+        q3.set(vs3)
+        vs4.value = bit4
+        q4.set(vs4)
 
     def _read_count(self):
         bits = [pin.state for pin in self.inputs]
@@ -767,8 +1064,8 @@ class FourBitAdder(PoweredPart):
         self.A3 = Pin(14)
         self.B3 = Pin(15)
 
-        self.a = [self.A1, self.A2, self.A3, self.A4]
-        self.b = [self.B1, self.B2, self.B3, self.B4]
+        self.a = (self.A1, self.A2, self.A3, self.A4)
+        self.b = (self.B1, self.B2, self.B3, self.B4)
         self.sum = [
             (self.S1, VoltageSource(False)),
             (self.S2, VoltageSource(False)),
@@ -776,11 +1073,12 @@ class FourBitAdder(PoweredPart):
             (self.S4, VoltageSource(False)),
         ]
         self._carry_out_vs = VoltageSource(False)
+        self.sum_value = 0
 
         super().__init__(vcc=Pin(16), gnd=Pin(8))
 
     def _write(self, value: int):
-        for bit, (pin, vs) in zip(int_to_list(value, 4), self.sum):
+        for bit, (pin, vs) in zip(_NIBBLE_BITS[value], self.sum):
             vs.value = bit
             pin.set(vs)
 
@@ -800,15 +1098,17 @@ class FourBitAdder(PoweredPart):
     def evaluate(self):
         super().evaluate()
 
-        a = list_to_int([pin.state for pin in self.a])
-        b = list_to_int([pin.state for pin in self.b])
-        carry = int(self.CARRY_IN.state or False)
+        a1, a2, a3, a4 = self.a
+        b1, b2, b3, b4 = self.b
+        a = bool(a1.state) | bool(a2.state) << 1 | bool(a3.state) << 2 | bool(a4.state) << 3
+        b = bool(b1.state) | bool(b2.state) << 1 | bool(b3.state) << 2 | bool(b4.state) << 3
 
-        result = a + b + carry
-        result_carry = bool(result & (1 << 4))
-        result_non_carry = result & 0b1111
+        self.drive(a + b + bool(self.CARRY_IN.state))
 
-        self._carry_out_vs.value = result_carry
+    def drive(self, result: int):
+        """Drive the sum and carry out pins with a result computed elsewhere. Bit 4 is the carry."""
+        self._carry_out_vs.value = bool(result & (1 << 4))
         self.CARRY_OUT.set(self._carry_out_vs)
 
-        self._write(result_non_carry)
+        self.sum_value = result & 0b1111
+        self._write(self.sum_value)
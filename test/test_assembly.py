@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import collections
 import dataclasses
+import io
 from typing import Tuple
 
 import pytest
@@ -81,6 +82,7 @@ def test_clock_in_data(empty_register: RegisterTestHarness):
 
     assert empty_register.bus.value == [True] + [False] * 7
     assert empty_register.register.register_bus.value == [True] + [False] * 7
+    assert str(empty_register.register) == "Register(00000001)"
 
 
 def test_cannot_clock_in_with_address_in_disabled(empty_register: RegisterTestHarness):
@@ -228,7 +230,8 @@ def program_counter() -> ProgramCounterTestHarness:
 def test_increment_program_counter(program_counter: ProgramCounterTestHarness):
     # Nothing on bus. Count 7 times.
     assert program_counter.bus.value == [None] * 8
-    [program_counter.do_clock() for _ in range(7)]
+    for _ in range(7):
+        program_counter.do_clock()
 
     # Stop counting, enable count output
     program_counter.counter_enable.voltage.value = False
@@ -279,8 +282,8 @@ class AluTestHarness:
         return eater.part.list_to_int([p.state for p in self.bus.conductors])
 
 
-@pytest.fixture()
-def alu() -> AluTestHarness:
+@pytest.fixture(params=[False, True], ids=["gates", "fast"])
+def alu(request) -> AluTestHarness:
     vcc = input_pin(True)
     gnd = input_pin(False)
 
@@ -303,7 +306,8 @@ def alu() -> AluTestHarness:
         flags_in=flags_in.pin,
         carry_out=carry_out,
         zero_out=zero_out,
-        a_bus=a_bus, b_bus=b_bus, bus=main_bus
+        a_bus=a_bus, b_bus=b_bus, bus=main_bus,
+        fast=request.param,
     )
 
     return AluTestHarness(
@@ -350,19 +354,85 @@ def test_alu_can_add(
     assert actual_zero == expected_zero
 
 
+def test_output_writes_bus_value():
+    clk = input_pin(True)
+    clr = input_pin(False)
+    output_enable = input_pin(True)
+    bus = eater.part.Bus([eater.part.Junction() for _ in range(8)])
+    stream = io.StringIO()
+
+    output = eater.assembly.Output(clk.pin, clr.pin, output_enable.pin, bus, stream=stream)
+    bus.pull_to(eater.part.int_to_list(3, 8))
+    output.evaluate()
+
+    assert output.value == 3
+    assert stream.getvalue() == "Output: 3\t0b11\t0x3\n"
+
+
 def test_control_runs():
-    control = eater.assembly.Control()
+    """The fast ALU outputs the same values as the gate-level ALU."""
+    outputs = []
+    for fast_mode in (False, True):
+        control = eater.assembly.Control(fast_mode=fast_mode)
+        stream = io.StringIO()
+        control.output.stream = stream
+
+        lda = 0b0000 << 4
+        add = 0b0001 << 4
+
+        control.ram.fiddle(0, lda | 14)
+        control.ram.fiddle(1, add | 15)
+
+        control.ram.fiddle(14, 1)
+        control.ram.fiddle(15, 2)
+
+        control.lda()
+        control.add()
+        control.out()
+        outputs.append((control.output.value, stream.getvalue()))
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0][0] == 3
 
-    lda = 0b0000 << 4
-    add = 0b0001 << 4
 
-    control.ram.fiddle(0, lda | 14)
-    control.ram.fiddle(1, add | 15)
+def test_output_writes_on_every_clocked_sweep():
+    """The output writes a line for every sweep of a clock cycle, however many sweeps are requested."""
+    control = eater.assembly.Control()
+    stream = io.StringIO()
+    control.output.stream = stream
 
+    control.ram.fiddle(0, (0b0000 << 4) | 14)
+    control.ram.fiddle(1, (0b0001 << 4) | 15)
     control.ram.fiddle(14, 1)
     control.ram.fiddle(15, 2)
-
     control.lda()
     control.add()
-    control.out()
-    print()
+
+    control.a_out.off()
+    control.output_enable.on()
+    control.do_clock()
+    control.do_clock()
+    control.do_clock(3)
+
+    assert stream.getvalue() == "Output: 3\t0b11\t0x3\n" * 7
+
+
+def test_control_loads_program():
+    control = eater.assembly.Control()
+    control.load_program()
+
+    assert control.PROGRAM == ((0b0000, 14), (0b0001, 15), (0b1110, 0))
+    assert list(control.ram.ram._memory[0:3]) == [0b0000_1110, 0b0001_1111, 0b1110_0000]
+
+
+@pytest.mark.parametrize("program", ["LDA 16", "ADD -1", "JMP 3"])
+def test_parse_program_rejects_invalid_instructions(program: str):
+    with pytest.raises(ValueError):
+        eater.assembly._parse_program(program)
+
+
+def test_control_rejects_out_of_range_operand():
+    control = eater.assembly.Control()
+
+    with pytest.raises(ValueError):
+        control.load_program(((0b0000, 16),))
@@ -61,3 +61,78 @@ def test_conductor_sets_values():
     input_wire.set(eater.part.VoltageSource(True))
     assert output_wire.state
 
+
+def test_constant_junction_cannot_be_switched():
+    """Constant power rails raise if switched."""
+    rail = eater.part.PoweredJunction(True, constant=True)
+    assert rail.state
+
+    with pytest.raises(ValueError):
+        rail.off()
+
+
+def test_rewiring_updates_state():
+    """Conductors connected after a state read are included in later reads."""
+    input_wire = eater.part.Junction()
+    output_wire = eater.part.Junction()
+    input_wire.set(eater.part.VoltageSource(True))
+
+    assert output_wire.state is None
+
+    output_wire.conductors.append(input_wire)
+    assert output_wire.state
+
+
+def test_activity_tracks_level_changes():
+    """Activity only changes when a logic level might have changed."""
+    pin = eater.part.Junction()
+    voltage_source = eater.part.VoltageSource(True)
+
+    before = eater.part.activity()
+    pin.set(voltage_source)
+    assert eater.part.activity() != before
+
+    before = eater.part.activity()
+    pin.set(voltage_source)
+    voltage_source.value = True
+    assert eater.part.activity() == before
+
+    voltage_source.value = False
+    assert eater.part.activity() != before
+
+
+def test_cached_state_follows_source_level():
+    """A state read is not reused after a source on the net changes level."""
+    input_wire = eater.part.Junction()
+    output_wire = eater.part.Junction([input_wire])
+    voltage_source = eater.part.VoltageSource(True)
+    input_wire.set(voltage_source)
+
+    assert output_wire.state
+    assert output_wire.state
+
+    voltage_source.value = False
+    assert output_wire.state is False
+
+
+def test_bus_packs_driven_lines():
+    """Packed bus values round trip, with undriven lines left out of the valid mask."""
+    bus = eater.part.Bus([eater.part.Junction() for _ in range(8)])
+    assert bus.pack() == (0, 0)
+
+    bus.unpack(0b0000_0101, 0b0000_1111)
+    assert bus.value == [True, False, True, False] + [None] * 4
+    assert bus.pack() == (0b0000_0101, 0b0000_1111)
+
+
+def test_junction_str_shows_state():
+    """Junctions print floating, low and high states as x, 0 and 1."""
+    pin = eater.part.Junction()
+    assert str(pin) == "Junction(x)"
+
+    voltage_source = eater.part.VoltageSource(False)
+    pin.set(voltage_source)
+    assert str(pin) == "Junction(0)"
+
+    voltage_source.value = True
+    assert str(pin) == "Junction(1)"